@@ -1,23 +1,57 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import html
+import http.client
 import json
 import math
 import os
 import re
+import string
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List, Set, Tuple
 from urllib.parse import parse_qs, urljoin, urlparse
 from urllib.request import Request, urlopen
+from wsgiref.simple_server import WSGIServer, make_server
 
 try:
     import requests
-except Exception:  # pragma: no cover
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # pragma: no cover
     requests = None
 
+# Single-shot whole-page HTML searches use RE2 (google-re2) when installed: it matches
+# in linear time, so malformed markup cannot trigger backtracking blowups. Without it
+# they fall back to the stdlib engine. Patterns compiled with _re_html must stay
+# RE2-compatible (no backreferences or lookarounds) and carry their flags inline, e.g.
+# "(?i)". RE2's wrapper re-encodes the whole str on every call, so anything searched
+# repeatedly from a moving position (the _scan_html tokenizer) must stay on stdlib re.
+try:
+    import re2 as _re_html
+except ImportError:  # pragma: no cover
+    _re_html = re
+
+# orjson handles JSON-LD blocks and the Sally AI request/response bodies faster than
+# the stdlib when installed. _json_dumps returns UTF-8 bytes in both cases.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 HOST = "0.0.0.0"
 PORT = int(os.environ.get("PORT", "8000"))
 USER_AGENT = (
@@ -25,6 +59,49 @@ USER_AGENT = (
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/122.0.0.0 Safari/537.36"
 )
+# (connect, read) seconds for page fetches and the Sally AI call.
+FETCH_TIMEOUT = (4, 8)
+AI_TIMEOUT = (3.05, 40)
+FETCH_WORKERS = 8
+# Page bodies are read up to this many (decompressed) bytes; the rest is dropped.
+MAX_HTML_BYTES = 2_000_000
+# Evaluations of the same (content_type, url) are reused for this many seconds.
+EVAL_CACHE_TTL = 300.0
+EVAL_CACHE_SIZE = 512
+# Fetched pages are reused per URL (e.g. across content types) for this many seconds.
+FETCH_CACHE_TTL = 3600.0
+FETCH_CACHE_SIZE = 128
+# Total characters of cached page HTML; the least recently used pages go first.
+FETCH_CACHE_MAX_CHARS = 16_000_000
+# Successful Sally AI reviews are reused for identical requests (same API key and
+# request body) for this many seconds.
+AI_CACHE_TTL = 86400.0
+AI_CACHE_SIZE = 500
+# Character caps on what the Sally AI payload carries from the page.
+AI_TEXT_LIMIT = 6500
+AI_META_LIMIT = 500
+# HTML responses at least this many bytes are gzipped for clients that accept it.
+GZIP_THRESHOLD = 1024
+
+
+def _build_session() -> "requests.Session":
+    # One pooled session for the process so repeat fetches and Sally AI calls reuse
+    # TCP/TLS connections. The single retry is for connection errors only: a status
+    # retry would sleep on the server's Retry-After, outside FETCH_TIMEOUT.
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=1, status=0, backoff_factor=0.3, respect_retry_after_header=False
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session() if requests is not None else None
 
 BLOG_RUBRIC = [
     "등록한 이미지의 퀄리티",
@@ -41,8 +118,100 @@ INSTAGRAM_RUBRIC = [
     "등록한 인스타그램 계정의 좋아요, 댓글등 반응",
 ]
 
+# Compiled once at import; the parsing/scoring helpers below run on every request.
+_RE_IFRAME_MAIN = _re_html.compile(r'(?i)<iframe[^>]+id=["\']mainFrame["\'][^>]+src=["\']([^"\']+)["\']')
+# Tokenizer for _scan_html: the opening tag of a raw-text element (its body is
+# skipped up to the matching _RE_RAW_TEXT_END), a tag whose attributes we read,
+# or any other markup. Stdlib re on purpose: _scan_html calls search() once per
+# token, which under RE2 would re-encode the page each time (quadratic).
+_RE_TOKEN = re.compile(r"(?i)<(?:(script|style|title)\b([^>]*)>|(img|a|meta)\b([^>]*)>|[^>]+>)")
+_RE_RAW_TEXT_END = {
+    "script": re.compile(r"(?i)</script\s*>"),
+    "style": re.compile(r"(?i)</style\s*>"),
+    "title": re.compile(r"(?i)</title\s*>"),
+}
+_RE_TAG_ATTR = re.compile(r"""([^\s"'=<>/]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+)))?""")
+_RE_HASHTAG = re.compile(r"#([A-Za-z0-9_가-힣]{2,30})")
+if _re_html is re and sys.version_info >= (3, 11):
+    # The stdlib engine backtracks, so the lazy "[\s\S]*?" bodies are unrolled into
+    # possessive "[^<]*+(?:<(?!closer)[^<]*+)*+" loops: each "<" is tested once and an
+    # unterminated block fails without re-trying every split. RE2 lacks lookahead but
+    # is linear anyway, and pre-3.11 re has no possessive quantifiers.
+    _RE_TITLE = re.compile(r"(?i)<title>([^<]*+(?:<(?!/title>)[^<]*+)*+)</title>")
+    _RE_NAVER_SE_MAIN_BLOCK = re.compile(
+        r'(?i)<div class="se-main-container"[^<]*+(?:<(?!/div>\s*</div>)[^<]*+)*+</div>\s*</div>'
+    )
+else:  # pragma: no cover
+    _RE_TITLE = _re_html.compile(r"(?i)<title>([\s\S]*?)</title>")
+    _RE_NAVER_SE_MAIN_BLOCK = _re_html.compile(r'(?i)<div class="se-main-container"[\s\S]*?</div>\s*</div>')
+_RE_NAVER_POST_VIEW = _re_html.compile(r'(?i)<div id="post-view\d+"')
+_RE_NAVER_SE_MAIN = _re_html.compile(r'(?i)<div[^>]+class="[^"]*se-main-container[^"]*"')
+_RE_NAVER_FOOTER = _re_html.compile(r'(?i)<div[^>]+id="post_footer"')
+_RE_HEAD_END = _re_html.compile(r"(?i)</head\s*>")
+_RE_VIDEO = _re_html.compile(
+    r"(?i)(youtube\.com/embed|player\.vimeo\.com|<video\b|<iframe[^>]+video|v2_video|se-video|_gifmp4|movie_count\":\s*[1-9])"
+)
+_RE_MAP = _re_html.compile(
+    r"(?i)(maps\.google\.com|openstreetmap|kakaomap|naver\.com\/map|<iframe[^>]+map|\"type\":\"v2_map\"|class=\"se-map|static\.map|korea_map\":\s*[1-9]|data-linktype=\"map\")"
+)
+# Applied to the lowercased text (parsed.text_lower).
+_RE_PORTRAIT = re.compile(r"(portrait|face|selfie|인물|셀카)")
+_RE_SENTENCE_SPLIT = re.compile(r"[.!?]+")
+_RE_FIRST_PERSON = re.compile(r"(저|제가|나는|내가)")
+_RE_MULTI_SPACE = re.compile(r"\s{2,}")
+_RE_PUNCT_REPEAT = re.compile(r"[!?.,]{3,}")
+_RE_JAMO = re.compile(r"[ㄱ-ㅎㅏ-ㅣ]{3,}")
+_RE_DATE = re.compile(r"20\d{2}[./년-]\s?\d{1,2}")
+_RE_NUMBER = re.compile(r"\d+[.,]?\d*")
+
+
+def _keyword_alternation(words: List[str]) -> re.Pattern:
+    # The alternation sits in a lookahead so matches may overlap: in "데일리뷰티" both
+    # "데일리" and "리뷰" are found, as the per-word `in` test would. Only one keyword
+    # is captured per offset (longest first), so no set may hold a keyword that is a
+    # prefix of another.
+    alternation = "|".join(re.escape(w) for w in sorted(set(words), key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+# Keyword sets scanned with one alternation per set. Scorers count distinct keywords
+# present, so callers take len(set(findall(...))) rather than the number of matches.
+_RE_OBJECTIVITY_KWS = _keyword_alternation(["장점", "단점", "비교", "근거", "수치", "후기", "개인적", "주관", "객관"])
+_RE_STRUCTURE_KWS = _keyword_alternation(["처음", "먼저", "다음", "그리고", "결론", "정리", "마지막"])
+_RE_SOURCE_KWS = _keyword_alternation(["출처", "통계", "공식", "자료", "리포트", "논문"])
+_RE_PLACE_KWS = _keyword_alternation(
+    [
+        "카페", "레스토랑", "해변", "공원", "스튜디오", "호텔", "거리", "매장", "오피스", "집",
+        "seoul", "busan", "tokyo", "paris", "new york", "beach", "cafe", "restaurant", "studio",
+    ]
+)
+_RE_PRODUCT_KWS = _keyword_alternation(["제품", "브랜드", "신상", "리뷰", "광고", "협찬", "출시", "model", "review", "brand"])
+_RE_PRODUCT_TAG_KWS = _keyword_alternation(["ad", "review", "brand", "item", "제품", "리뷰"])
+_KEYWORD_HITS_CACHE: Dict[Tuple[str, ...], re.Pattern] = {}
+
+# Per-key patterns for extract_count/extract_meta, built on first use.
+_COUNT_CACHE: Dict[str, Any] = {}
+_META_CACHE: Dict[str, Any] = {}
+
+# Image hosts that serve a Naver post's own attachments (not skins, stickers or ads).
+NAVER_POST_IMAGE_HOSTS = (
+    "postfiles.pstatic.net",
+    "blogfiles.pstatic.net",
+    "blogthumb.pstatic.net",
+    "mblogvideo-phinf.pstatic.net",
+    "phinf.pstatic.net/image.nmv",
+)
+LIKE_KEYS = ["like_count", "likes", "좋아요"]
+COMMENT_KEYS = ["comment_count", "comments", "댓글"]
+LIKE_FALLBACK_KEYS = ["edge_media_preview_like", "likeCount", "reaction_count"]
+COMMENT_FALLBACK_KEYS = ["edge_media_to_comment", "commentCount"]
+
+
+# __slots__ on the result/parse dataclasses where the interpreter supports it (3.10+).
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class EvalResult:
     content_type: str
     url: str
@@ -56,24 +225,155 @@ class EvalResult:
     notes: List[str]
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class Parsed:
+    """Page features extracted by parse_common; the defaults describe an empty page."""
+
+    text: str = ""
+    text_lower: str = ""
+    links: int = 0
+    images: List[Dict[str, object]] = field(default_factory=list)
+    # Image counts tallied once in parse_common for the scorers and overviews:
+    # both sides >= 500px, non-empty alt, and alt of 8+ characters.
+    images_sized: int = 0
+    images_with_alt: int = 0
+    images_rich_alt: int = 0
+    hashtags: List[str] = field(default_factory=list)
+    likes: int | None = None
+    comments: int | None = None
+    title: str = ""
+    description: str = ""
+    json_ld_count: int = 0
+    word_count: int = 0
+    char_count: int = 0
+    video_embedded: bool = False
+    map_embedded: bool = False
+
+
 def clamp_1_5(value: float) -> float:
-    return max(1.0, min(5.0, value))
+    return value if 1.0 <= value <= 5.0 else (1.0 if value < 1.0 else 5.0)
 
 
 def round_half(value: float) -> float:
     return round(value * 2) / 2
 
 
+def round_scores(rubric: List[str], values: Tuple[float, ...]) -> Dict[str, float]:
+    # Rounds each rubric score to the nearest 0.5 in one pass.
+    return {item: round_half(value) for item, value in zip(rubric, values)}
+
+
 def safe_int(value: str | None) -> int | None:
     if not value:
         return None
     try:
         return int(value.replace(",", ""))
-    except Exception:
+    except ValueError:
         return None
 
 
-def fetch_html(url: str) -> Tuple[str, List[str]]:
+class _TTLCache:
+    """Thread-safe LRU map whose entries expire ``ttl`` seconds after insertion.
+
+    With ``maxcost`` set, the summed ``cost`` passed to :meth:`put` is bounded too.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, maxcost: int = 0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._maxcost = maxcost
+        self._cost = 0
+        self._data: OrderedDict[Any, Tuple[float, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if item[0] <= time.monotonic():
+                del self._data[key]
+                self._cost -= item[2]
+                return None
+            self._data.move_to_end(key)
+            return item[1]
+
+    def put(self, key: Any, value: Any, cost: int = 0) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._cost -= old[2]
+            if self._maxcost and cost > self._maxcost:
+                return
+            self._data[key] = (time.monotonic() + self._ttl, value, cost)
+            self._cost += cost
+            while len(self._data) > self._maxsize or (self._maxcost and self._cost > self._maxcost):
+                self._cost -= self._data.popitem(last=False)[1][2]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._cost = 0
+
+
+_RE_HEADER_CHARSET = re.compile(r"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+_RE_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+
+def decode_html(raw: bytes, content_type: str = "") -> str:
+    # Decode the body ourselves instead of via requests' .text, which runs charset
+    # detection over the whole document when the header names no charset (and
+    # assumes ISO-8859-1 for text/html). Header charset, then <meta charset>, then UTF-8.
+    m = _RE_HEADER_CHARSET.search(content_type)
+    if m:
+        charset = m.group(1)
+    else:
+        meta = _RE_META_CHARSET.search(raw, 0, 4096)
+        charset = meta.group(1).decode("ascii") if meta else "utf-8"
+    try:
+        return raw.decode(charset, errors="replace")
+    except (LookupError, UnicodeError):
+        # Unknown names, and codecs such as idna/punycode that raise regardless of errors=.
+        return raw.decode("utf-8", errors="replace")
+
+
+_FETCH_CACHE = _TTLCache(FETCH_CACHE_SIZE, FETCH_CACHE_TTL, FETCH_CACHE_MAX_CHARS)
+
+
+def fetch_html(url: str) -> Tuple[str, List[str], bool]:
+    cached = _FETCH_CACHE.get(url)
+    if cached is not None:
+        # Callers append to the notes list, so hand out a copy.
+        return cached[0], list(cached[1]), False
+    html_text, notes, partial = download_html(url)
+    if html_text and not partial:
+        _FETCH_CACHE.put(url, (html_text, list(notes)), len(html_text))
+    return html_text, notes, partial
+
+
+def is_html_content_type(content_type: str) -> bool:
+    # Only HTML/XHTML (or a missing header, given the benefit of the doubt) is parsed;
+    # plain text, CSS, images, PDFs, JSON etc. are not.
+    mime = content_type.split(";", 1)[0].strip().lower()
+    return not mime or mime in ("text/html", "application/xhtml+xml")
+
+
+def _read_capped(resp: "requests.Response") -> bytes:
+    # resp must come from a stream=True request: stop pulling from the socket once
+    # MAX_HTML_BYTES have arrived so oversized pages bound both memory and parse time.
+    chunks: List[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= MAX_HTML_BYTES:
+            break
+    return b"".join(chunks)[:MAX_HTML_BYTES]
+
+
+def download_html(url: str) -> Tuple[str, List[str], bool]:
+    # The flag is True when the page is a Naver frameset whose PostView document
+    # could not be fetched, i.e. the HTML is only the empty frame shell.
     notes: List[str] = []
     attempts = [
         {"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8"},
@@ -83,175 +383,286 @@ def fetch_html(url: str) -> Tuple[str, List[str]]:
     final_html = ""
     final_url = url
 
-    if requests is not None:
+    if _SESSION is not None:
         for idx, headers in enumerate(attempts, start=1):
+            if idx > 1:
+                time.sleep(0.3)
             try:
-                resp = requests.get(
+                resp = _SESSION.get(
                     url,
                     headers=headers,
-                    timeout=12,
+                    timeout=FETCH_TIMEOUT,
                     allow_redirects=True,
+                    stream=True,
                 )
-                if resp.ok and resp.text:
-                    final_html = resp.text
+                ctype = resp.headers.get("Content-Type", "")
+                html_ok = resp.ok and is_html_content_type(ctype)
+                try:
+                    # Error and non-HTML responses are closed without reading the body.
+                    body = _read_capped(resp) if html_ok else b""
+                finally:
+                    resp.close()
+                if body:
+                    final_html = decode_html(body, ctype)
                     final_url = resp.url
                     break
+                if resp.ok and not html_ok:
+                    # Another attempt or the urllib fallback would get the same resource.
+                    notes.append(f"수집 시도 {idx} 실패(HTML 문서 아님: {ctype})")
+                    notes.append("URL 수집 실패로 제한된 평가를 수행했습니다.")
+                    return "", notes, False
                 notes.append(f"수집 시도 {idx} 실패(HTTP {resp.status_code})")
-            except Exception as exc:
+            except requests.RequestException as exc:
                 notes.append(f"수집 시도 {idx} 실패: {exc}")
-            time.sleep(0.3)
 
     if not final_html:
         for idx, headers in enumerate(attempts, start=1):
+            if idx > 1:
+                time.sleep(0.3)
             try:
                 req = Request(url, headers=headers)
-                with urlopen(req, timeout=12) as resp:
-                    raw = resp.read()
-                    charset = resp.headers.get_content_charset() or "utf-8"
-                    final_html = raw.decode(charset, errors="replace")
+                # urllib takes one per-operation timeout; allow the connect + read budget.
+                with urlopen(req, timeout=sum(FETCH_TIMEOUT)) as resp:
+                    ctype = resp.headers.get("Content-Type", "")
+                    if not is_html_content_type(ctype):
+                        notes.append(f"보조 수집 시도 {idx} 실패(HTML 문서 아님: {ctype})")
+                        continue
+                    final_html = decode_html(resp.read(MAX_HTML_BYTES), ctype)
                     final_url = url
                     break
-            except Exception as exc:
+            except (OSError, ValueError, http.client.HTTPException) as exc:
+                # URLError/socket.timeout are OSErrors; ValueError is a malformed URL.
                 notes.append(f"보조 수집 시도 {idx} 실패: {exc}")
-            time.sleep(0.3)
 
     if not final_html:
         notes.append("URL 수집 실패로 제한된 평가를 수행했습니다.")
-        return "", notes
-
-    # Naver blog often serves a frameset page; fetch the real PostView document.
-    frame_match = re.search(
-        r'<iframe[^>]+id=["\']mainFrame["\'][^>]+src=["\']([^"\']+)["\']',
-        final_html,
-        flags=re.IGNORECASE,
-    )
-    if frame_match and requests is not None:
+        return "", notes, False
+
+    # Naver blog often serves a frameset page; fetch the real PostView document. The
+    # plain substring test (case-insensitive, like the regex) rules out ordinary
+    # pages before the iframe regex runs.
+    frame_match = None
+    if _SESSION is not None and "mainframe" in final_html.lower():
+        frame_match = _RE_IFRAME_MAIN.search(final_html)
+    partial = False
+    if frame_match:
         frame_src = frame_match.group(1)
         frame_url = urljoin(final_url, frame_src)
         try:
-            resp2 = requests.get(
+            resp2 = _SESSION.get(
                 frame_url,
                 headers={"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9"},
-                timeout=12,
+                timeout=FETCH_TIMEOUT,
                 allow_redirects=True,
+                stream=True,
             )
-            if resp2.ok and resp2.text:
-                final_html = resp2.text
+            ctype = resp2.headers.get("Content-Type", "")
+            html_ok = resp2.ok and is_html_content_type(ctype)
+            try:
+                body = _read_capped(resp2) if html_ok else b""
+            finally:
+                resp2.close()
+            if body:
+                final_html = decode_html(body, ctype)
                 final_url = resp2.url
                 notes.append("프레임셋 본문(PostView) 페이지를 추가 수집했습니다.")
-        except Exception as exc:
+            else:
+                partial = True
+                if not resp2.ok:
+                    notes.append(f"PostView 추가 수집 실패(HTTP {resp2.status_code})")
+                elif not html_ok:
+                    notes.append(f"PostView 추가 수집 실패(HTML 문서 아님: {ctype})")
+                else:
+                    notes.append("PostView 추가 수집 실패(빈 응답)")
+        except requests.RequestException as exc:
+            partial = True
             notes.append(f"PostView 추가 수집 실패: {exc}")
 
-    return final_html, notes
+    return final_html, notes, partial
 
 
-def strip_tags(text: str) -> str:
-    text = re.sub(r"<script[\s\S]*?</script>", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"<style[\s\S]*?</style>", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = html.unescape(text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
-def parse_images(html_text: str) -> List[Dict[str, object]]:
-    images: List[Dict[str, object]] = []
-    img_tags = re.findall(r"<img\b[^>]*>", html_text, flags=re.IGNORECASE)
-    for tag in img_tags:
-        src = extract_attr(tag, "src")
-        if not src:
-            continue
-        alt = extract_attr(tag, "alt") or ""
-        width = safe_int(extract_attr(tag, "width"))
-        height = safe_int(extract_attr(tag, "height"))
-        images.append({"src": src, "alt": alt, "width": width, "height": height})
-
-        srcset = extract_attr(tag, "srcset") or ""
-        if srcset:
-            for chunk in srcset.split(","):
-                part = chunk.strip().split(" ")[0].strip()
-                if part and not any(img["src"] == part for img in images):
-                    images.append({"src": part, "alt": alt, "width": None, "height": None})
-
-    og_images = re.findall(
-        r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']',
-        html_text,
-        flags=re.IGNORECASE,
-    )
-    for src in og_images[:20]:
-        if not any(img["src"] == src for img in images):
-            images.append({"src": src, "alt": "", "width": None, "height": None})
-    return images
-
-
-def extract_attr(tag: str, attr: str) -> str | None:
-    pat = re.compile(rf'{attr}\s*=\s*["\']([^"\']+)["\']', flags=re.IGNORECASE)
-    m = pat.search(tag)
-    return m.group(1).strip() if m else None
-
-
-def parse_links_count(html_text: str) -> int:
-    hrefs = re.findall(r'<a\b[^>]*href=["\']([^"\']+)["\']', html_text, flags=re.IGNORECASE)
-    clean: List[str] = []
-    for href in hrefs:
-        v = href.strip()
-        if not v:
-            continue
-        low = v.lower()
-        if low.startswith("#") or low.startswith("javascript:") or low.startswith("about:blank"):
-            continue
-        clean.append(v)
-    return len(set(clean))
+def fetch_html_many(urls: List[str]) -> List[Tuple[str, List[str], bool]]:
+    # fetch_html is I/O bound, so a small thread pool overlaps the network waits.
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as pool:
+        return list(pool.map(fetch_html, urls))
 
 
 def parse_hashtags(text: str) -> List[str]:
-    return re.findall(r"#([A-Za-z0-9_가-힣]{2,30})", text)
+    return _RE_HASHTAG.findall(text)
 
 
 def extract_count(html_text: str, keys: List[str]) -> int | None:
     for key in keys:
-        pat = re.compile(rf'{re.escape(key)}[^0-9]{{0,15}}([0-9]{{1,9}})', flags=re.IGNORECASE)
+        pat = _COUNT_CACHE.get(key)
+        if pat is None:
+            pat = _COUNT_CACHE[key] = _re_html.compile(rf"(?i){re.escape(key)}[^0-9]{{0,15}}([0-9]{{1,9}})")
         m = pat.search(html_text)
         if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                pass
+            # The group is 1-9 ASCII digits, so int() cannot fail.
+            return int(m.group(1))
     return None
 
 
 def extract_meta(html_text: str, key: str) -> str:
-    patterns = [
-        rf'<meta[^>]+property=["\']{re.escape(key)}["\'][^>]+content=["\']([^"\']+)["\']',
-        rf'<meta[^>]+name=["\']{re.escape(key)}["\'][^>]+content=["\']([^"\']+)["\']',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html_text, flags=re.IGNORECASE)
-        if match:
-            return html.unescape(match.group(1)).strip()
-    return ""
+    # property= and name= in one pattern, so the document is searched once per key.
+    pattern = _META_CACHE.get(key)
+    if pattern is None:
+        pattern = _META_CACHE[key] = _re_html.compile(
+            rf'(?i)<meta[^>]+(?:property|name)=["\']{re.escape(key)}["\'][^>]+content=["\']([^"\']+)["\']'
+        )
+    match = pattern.search(html_text)
+    return html.unescape(match.group(1)).strip() if match else ""
+
+
+def _parse_attrs(raw: str) -> Dict[str, str]:
+    attrs: Dict[str, str] = {}
+    for name, dq, sq, bare in _RE_TAG_ATTR.findall(raw):
+        name = name.lower()
+        if name not in attrs:
+            attrs[name] = html.unescape(dq or sq or bare).strip()
+    return attrs
+
+
+class _Collector:
+    """Page text, images, links, meta tags, title and JSON-LD gathered by _scan_html."""
+
+    def __init__(self) -> None:
+        self.text_parts: List[str] = []
+        self.images: List[Dict[str, object]] = []
+        self.image_srcs: Set[str] = set()
+        self.og_images: List[str] = []
+        self.links: Set[str] = set()
+        self.meta_property: Dict[str, str] = {}
+        self.meta_name: Dict[str, str] = {}
+        self.title = ""
+        self.json_ld_chunks: List[str] = []
+
+    def add_image(self, attrs: Dict[str, str]) -> None:
+        # Lazy-loading markup (Naver SmartEditor, most CMS themes) keeps the real
+        # values in data-* attributes; use them when the plain one is missing.
+        src = attrs.get("src") or attrs.get("data-src") or attrs.get("data-lazy-src")
+        if not src:
+            return
+        images = self.images
+        seen = self.image_srcs
+        alt = attrs.get("alt", "")
+        width = safe_int(attrs.get("width") or attrs.get("data-width"))
+        height = safe_int(attrs.get("height") or attrs.get("data-height"))
+        images.append({"src": src, "alt": alt, "width": width, "height": height})
+        seen.add(src)
 
+        srcset = attrs.get("srcset") or attrs.get("data-srcset", "")
+        if srcset:
+            for chunk in srcset.split(","):
+                part = chunk.strip().split(" ")[0].strip()
+                if part and part not in seen:
+                    images.append({"src": part, "alt": alt, "width": None, "height": None})
+                    seen.add(part)
 
-def extract_json_ld_chunks(html_text: str) -> List[dict]:
-    chunks = re.findall(
-        r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>([\s\S]*?)</script>',
-        html_text,
-        flags=re.IGNORECASE,
-    )
-    parsed: List[dict] = []
-    for chunk in chunks:
-        text = chunk.strip()
-        if not text:
+    def add_link(self, attrs: Dict[str, str]) -> None:
+        v = attrs.get("href")
+        if not v:
+            return
+        low = v.lower()
+        if low.startswith("#") or low.startswith("javascript:") or low.startswith("about:blank"):
+            return
+        self.links.add(v)
+
+    def add_meta(self, attrs: Dict[str, str]) -> None:
+        content = attrs.get("content")
+        if not content:
+            return
+        prop = attrs.get("property", "").lower()
+        if prop:
+            if prop == "og:image":
+                self.og_images.append(content)
+            self.meta_property.setdefault(prop, content)
+        name = attrs.get("name", "").lower()
+        if name:
+            self.meta_name.setdefault(name, content)
+
+    def meta(self, key: str) -> str:
+        return self.meta_property.get(key) or self.meta_name.get(key) or ""
+
+    @property
+    def text(self) -> str:
+        return squash_ws(html.unescape(" ".join(self.text_parts)))
+
+    def json_ld(self) -> List[dict]:
+        parsed: List[dict] = []
+        for chunk in self.json_ld_chunks:
+            text = chunk.strip()
+            if not text:
+                continue
+            try:
+                obj = _json_loads(text)
+                if isinstance(obj, dict):
+                    parsed.append(obj)
+                elif isinstance(obj, list):
+                    parsed.extend([x for x in obj if isinstance(x, dict)])
+            except (ValueError, RecursionError):
+                # Malformed (json/orjson decode errors are ValueErrors) or absurdly nested.
+                continue
+        return parsed
+
+
+def _scan_html(html_text: str) -> _Collector:
+    # One tokenizer pass replaces the separate text/img/link/meta/title/JSON-LD scans.
+    # The text between tokens is the page text; only tags we read are parsed further.
+    page = _Collector()
+    append_text = page.text_parts.append
+    search = _RE_TOKEN.search
+    pos = 0
+    while True:
+        m = search(html_text, pos)
+        if m is None:
+            break
+        start, end = m.span()
+        append_text(html_text[pos:start])
+        pos = end
+        # Most tokens are plain markup with no captured group; skip them early.
+        if m.lastindex is None:
             continue
-        try:
-            obj = json.loads(text)
-            if isinstance(obj, dict):
-                parsed.append(obj)
-            elif isinstance(obj, list):
-                parsed.extend([x for x in obj if isinstance(x, dict)])
-        except Exception:
+        raw_tag, raw_attrs, tag, attrs = m.groups()
+        if raw_tag:
+            raw_tag = raw_tag.lower()
+            close = _RE_RAW_TEXT_END[raw_tag].search(html_text, end)
+            if close is None:
+                # Unterminated element: treat the opening tag as plain markup.
+                continue
+            pos = close.end()
+            if raw_tag == "script":
+                if "ld+json" in raw_attrs.lower() and _parse_attrs(raw_attrs).get("type", "").lower() == "application/ld+json":
+                    page.json_ld_chunks.append(html_text[end : close.start()])
+            elif raw_tag == "title":
+                body = html_text[end : close.start()]
+                append_text(body)
+                if not page.title:
+                    page.title = html.unescape(body).strip()
             continue
-    return parsed
+        tag = tag.lower()
+        if tag == "img":
+            page.add_image(_parse_attrs(attrs))
+        elif tag == "a":
+            page.add_link(_parse_attrs(attrs))
+        else:
+            page.add_meta(_parse_attrs(attrs))
+    append_text(html_text[pos:])
+
+    images = page.images
+    seen = page.image_srcs
+    for src in page.og_images[:20]:
+        if src not in seen:
+            images.append({"src": src, "alt": "", "width": None, "height": None})
+            seen.add(src)
+    return page
+
+
+def squash_ws(text: str) -> str:
+    # Collapses whitespace runs to single spaces and trims both ends.
+    return " ".join(text.split())
 
 
 def coalesce(*values: object) -> str:
@@ -263,25 +674,29 @@ def coalesce(*values: object) -> str:
 
 def extract_naver_post_body(html_text: str) -> str:
     # Prefer the real post-view block to avoid counting global navigation/sidebar text.
-    m = re.search(r'<div id="post-view\d+"', html_text, flags=re.IGNORECASE)
+    m = _RE_NAVER_POST_VIEW.search(html_text)
     if m:
         start = m.start()
-        se_main = re.search(r'<div[^>]+class="[^"]*se-main-container[^"]*"', html_text[start:], flags=re.IGNORECASE)
+        se_main = _RE_NAVER_SE_MAIN.search(html_text, start)
         if se_main:
-            start = start + se_main.start()
+            start = se_main.start()
         # post_footer appears after the article body area in Naver PostView pages.
-        footer_match = re.search(r'<div[^>]+id="post_footer"', html_text[start:], flags=re.IGNORECASE)
+        footer_match = _RE_NAVER_FOOTER.search(html_text, start)
         if footer_match:
-            end = start + footer_match.start()
-            return html_text[start:end]
+            return html_text[start:footer_match.start()]
         return html_text[start:]
     # Fallback to content area block.
-    m2 = re.search(r'<div class="se-main-container"[\s\S]*?</div>\s*</div>', html_text, flags=re.IGNORECASE)
+    m2 = _RE_NAVER_SE_MAIN_BLOCK.search(html_text)
     if m2:
         return m2.group(0)
     return html_text
 
 
+def _is_naver_post_image(src: str) -> bool:
+    low = src.lower()
+    return any(host in low for host in NAVER_POST_IMAGE_HOSTS)
+
+
 def estimate_tokens(text: str) -> int:
     if not text:
         return 0
@@ -303,72 +718,57 @@ def use_api_evaluator() -> bool:
     return os.environ.get("SALLY_EVAL_MODE", "local").strip().lower() == "api"
 
 
-def parse_common(html_text: str, source_url: str = "") -> Dict[str, object]:
+def parse_common(html_text: str, source_url: str = "", engagement: bool = True) -> Parsed:
+    # engagement=False skips the like/comment count scans over the raw HTML; likes
+    # and comments stay None.
     if not html_text:
-        return {
-            "text": "",
-            "links": 0,
-            "images": [],
-            "hashtags": [],
-            "likes": None,
-            "comments": None,
-            "title": "",
-            "description": "",
-            "json_ld_count": 0,
-            "word_count": 0,
-            "video_embedded": False,
-            "map_embedded": False,
-        }
+        return Parsed()
 
     is_naver_blog = "blog.naver.com" in source_url or "PostView.naver" in source_url or "blog.naver.com" in html_text
     base_html = extract_naver_post_body(html_text) if is_naver_blog else html_text
 
-    text = strip_tags(base_html)
-    images = parse_images(base_html)
-    links = parse_links_count(base_html)
+    page = _scan_html(base_html)
+    text = page.text
+    images = page.images
+    links = len(page.links)
     if is_naver_blog:
-        images = [
-            img
-            for img in images
-            if any(
-                key in str(img.get("src", "")).lower()
-                for key in [
-                    "postfiles.pstatic.net",
-                    "blogfiles.pstatic.net",
-                    "blogthumb.pstatic.net",
-                    "mblogvideo-phinf.pstatic.net",
-                    "phinf.pstatic.net/image.nmv",
-                ]
+        images = [img for img in images if _is_naver_post_image(str(img["src"]))]
+    images_sized = images_with_alt = images_rich_alt = 0
+    for img in images:
+        w = img["width"]
+        h = img["height"]
+        if isinstance(w, int) and isinstance(h, int) and w >= 500 and h >= 500:
+            images_sized += 1
+        alt = str(img["alt"])
+        if alt:
+            images_with_alt += 1
+            if len(alt) >= 8:
+                images_rich_alt += 1
+    # Insertion-ordered dict as a set: dedupes while keeping first-seen order.
+    tags: Dict[str, None] = dict.fromkeys(parse_hashtags(text))
+    json_ld = page.json_ld()
+    video_embedded = bool(_RE_VIDEO.search(base_html))
+    map_embedded = bool(_RE_MAP.search(base_html))
+
+    if base_html is html_text:
+        title = squash_ws(coalesce(page.meta("og:title"), page.title))
+        description = squash_ws(coalesce(page.meta("og:description"), page.meta("description")))
+    else:
+        # The post body slice has no <head>; fall back to the document head, so the
+        # title/meta searches never walk the (much larger) body markup.
+        head_end = _RE_HEAD_END.search(html_text)
+        head_html = html_text[: head_end.start()] if head_end else html_text
+        title_match = _RE_TITLE.search(head_html)
+        title_tag = html.unescape(title_match.group(1)).strip() if title_match else ""
+        title = squash_ws(coalesce(page.meta("og:title"), extract_meta(head_html, "og:title"), title_tag))
+        description = squash_ws(
+            coalesce(
+                page.meta("og:description"),
+                extract_meta(head_html, "og:description"),
+                page.meta("description"),
+                extract_meta(head_html, "description"),
             )
-        ]
-    hashtags = parse_hashtags(text)
-    likes = extract_count(base_html, ["like_count", "likes", "좋아요"])
-    comments = extract_count(base_html, ["comment_count", "comments", "댓글"])
-    json_ld = extract_json_ld_chunks(base_html)
-    video_embedded = bool(
-        re.search(
-            r"(youtube\.com/embed|player\.vimeo\.com|<video\b|<iframe[^>]+video|v2_video|se-video|_gifmp4|movie_count\":\s*[1-9])",
-            base_html,
-            flags=re.IGNORECASE,
         )
-    )
-    map_embedded = bool(
-        re.search(
-            r"(maps\.google\.com|openstreetmap|kakaomap|naver\.com\/map|<iframe[^>]+map|\"type\":\"v2_map\"|class=\"se-map|static\.map|korea_map\":\s*[1-9]|data-linktype=\"map\")",
-            base_html,
-            flags=re.IGNORECASE,
-        )
-    )
-
-    title_match = re.search(r"<title>([\s\S]*?)</title>", html_text, flags=re.IGNORECASE)
-    title_tag = html.unescape(title_match.group(1)).strip() if title_match else ""
-    title = coalesce(extract_meta(base_html, "og:title"), extract_meta(html_text, "og:title"), title_tag)
-    description = coalesce(
-        extract_meta(base_html, "og:description"),
-        extract_meta(html_text, "og:description"),
-        extract_meta(base_html, "description"),
-        extract_meta(html_text, "description"),
-    )
 
     for obj in json_ld:
         article_body = obj.get("articleBody")
@@ -376,43 +776,55 @@ def parse_common(html_text: str, source_url: str = "") -> Dict[str, object]:
         desc = obj.get("description")
         keywords = obj.get("keywords")
         for candidate in [article_body, caption, desc]:
+            # Appended as written: whitespace runs in these feed score_blog_spelling.
             if isinstance(candidate, str) and candidate.strip() and candidate not in text:
-                text = f"{text} {candidate.strip()}".strip()
+                text = f"{text} {candidate.strip()}" if text else candidate.strip()
         if isinstance(keywords, str):
-            hashtags.extend([w.strip().lstrip("#") for w in keywords.split(",") if w.strip()])
-
-    hashtags = [h for h in hashtags if len(h) >= 2]
-    hashtags = list(dict.fromkeys(hashtags))[:80]
-
-    if likes is None:
-        likes = extract_count(base_html, ["edge_media_preview_like", "likeCount", "reaction_count"])
-    if comments is None:
-        comments = extract_count(base_html, ["edge_media_to_comment", "commentCount"])
-
-    return {
-        "text": text,
-        "links": links,
-        "images": images,
-        "hashtags": hashtags,
-        "likes": likes,
-        "comments": comments,
-        "title": title,
-        "description": description,
-        "json_ld_count": len(json_ld),
-        "word_count": len(text.split()),
-        "char_count": len(re.sub(r"\s+", "", text)),
-        "video_embedded": video_embedded,
-        "map_embedded": map_embedded,
-    }
+            for word in keywords.split(","):
+                word = word.strip()
+                if word:
+                    tags[word.lstrip("#")] = None
+
+    hashtags = [h for h in tags if len(h) >= 2][:80]
+
+    likes = comments = None
+    if engagement:
+        likes = extract_count(base_html, LIKE_KEYS)
+        if likes is None:
+            likes = extract_count(base_html, LIKE_FALLBACK_KEYS)
+        comments = extract_count(base_html, COMMENT_KEYS)
+        if comments is None:
+            comments = extract_count(base_html, COMMENT_FALLBACK_KEYS)
+
+    words = text.split()
+    return Parsed(
+        text=text,
+        text_lower=text.lower(),
+        links=links,
+        images=images,
+        images_sized=images_sized,
+        images_with_alt=images_with_alt,
+        images_rich_alt=images_rich_alt,
+        hashtags=hashtags,
+        likes=likes,
+        comments=comments,
+        title=title,
+        description=description,
+        json_ld_count=len(json_ld),
+        word_count=len(words),
+        char_count=sum(map(len, words)),
+        video_embedded=video_embedded,
+        map_embedded=map_embedded,
+    )
 
 
-def build_dashboard(parsed: Dict[str, object]) -> Dict[str, str]:
-    words = int(parsed.get("word_count", 0))
-    chars = int(parsed.get("char_count", 0))
-    images = len(parsed.get("images", []))
-    links = int(parsed.get("links", 0))
-    video = bool(parsed.get("video_embedded", False))
-    map_data = bool(parsed.get("map_embedded", False))
+def build_dashboard(parsed: Parsed) -> Dict[str, str]:
+    words = parsed.word_count
+    chars = parsed.char_count
+    images = len(parsed.images)
+    links = parsed.links
+    video = parsed.video_embedded
+    map_data = parsed.map_embedded
     return {
         "포함된 텍스트 수": f"{chars}자 / {words}단어",
         "이미지 수": f"{images}",
@@ -423,15 +835,26 @@ def build_dashboard(parsed: Dict[str, object]) -> Dict[str, str]:
 
 
 def snippet(text: str, limit: int = 180) -> str:
-    clean = re.sub(r"\s+", " ", text).strip()
+    # Squash only as much text as the snippet needs: a squashed prefix agrees with
+    # the squashed whole text for its full length (JSON-LD candidates in
+    # parsed.text keep their own whitespace).
+    end = limit * 2
+    clean = squash_ws(text[:end])
+    while len(clean) <= limit and end < len(text):
+        end *= 2
+        clean = squash_ws(text[:end])
     if len(clean) <= limit:
         return clean or "본문 텍스트를 충분히 추출하지 못했습니다."
     return clean[:limit].rstrip() + "..."
 
 
-def keyword_hits(text: str, words: List[str]) -> int:
-    low = text.lower()
-    return sum(1 for w in words if w.lower() in low)
+def keyword_hits(text_lower: str, words: List[str]) -> int:
+    # text_lower must already be lowercased; words may use any case.
+    key = tuple(words)
+    pat = _KEYWORD_HITS_CACHE.get(key)
+    if pat is None:
+        pat = _KEYWORD_HITS_CACHE[key] = _keyword_alternation([w.lower() for w in words])
+    return len(set(pat.findall(text_lower)))
 
 
 def ratio(n: int, d: int) -> float:
@@ -480,9 +903,9 @@ def compose_expert_review(
     )
 
 
-def infer_audience(text: str, hashtags: List[str]) -> str:
-    hobby = keyword_hits(text, ["후기", "리뷰", "맛집", "여행", "카페", "OOTD", "데일리"])
-    pro = keyword_hits(text, ["분석", "비교", "가이드", "전략", "인사이트", "트렌드"])
+def infer_audience(text_lower: str, hashtags: List[str]) -> str:
+    hobby = keyword_hits(text_lower, ["후기", "리뷰", "맛집", "여행", "카페", "OOTD", "데일리"])
+    pro = keyword_hits(text_lower, ["분석", "비교", "가이드", "전략", "인사이트", "트렌드"])
     tags = " ".join([h.lower() for h in hashtags])
     if pro >= 3:
         return "정보 탐색형 독자(비교/검증 중심)"
@@ -491,10 +914,10 @@ def infer_audience(text: str, hashtags: List[str]) -> str:
     return "혼합형 독자층(정보+감성 동시 소비)"
 
 
-def content_maturity(parsed: Dict[str, object]) -> str:
-    words = int(parsed.get("word_count", 0))
-    images = len(parsed.get("images", []))
-    links = int(parsed.get("links", 0))
+def content_maturity(parsed: Parsed) -> str:
+    words = parsed.word_count
+    images = len(parsed.images)
+    links = parsed.links
     if words >= 600 and images >= 4 and links >= 2:
         return "완성도 높은 롱폼 구조"
     if words >= 250 and images >= 2:
@@ -502,90 +925,78 @@ def content_maturity(parsed: Dict[str, object]) -> str:
     return "경량형 콘텐츠 구조"
 
 
-def detect_place_clues(text: str) -> str:
-    place_words = [
-        "카페", "레스토랑", "해변", "공원", "스튜디오", "호텔", "거리", "매장", "오피스", "집",
-        "seoul", "busan", "tokyo", "paris", "new york", "beach", "cafe", "restaurant", "studio",
-    ]
-    hits = [w for w in place_words if w.lower() in text.lower()]
+def detect_place_clues(text_lower: str) -> str:
+    hits = set(_RE_PLACE_KWS.findall(text_lower))
     if not hits:
         return "장소 단서를 명확히 확인하지 못했습니다."
-    uniq = ", ".join(sorted(set(hits))[:4])
+    uniq = ", ".join(sorted(hits)[:4])
     return f"배경 장소 단서: {uniq}"
 
 
-def detect_product_focus(text: str, hashtags: List[str]) -> str:
-    product_words = ["제품", "브랜드", "신상", "리뷰", "광고", "협찬", "출시", "model", "review", "brand"]
-    has_product_word = any(w.lower() in text.lower() for w in product_words)
-    product_tags = [h for h in hashtags if any(k in h.lower() for k in ["ad", "review", "brand", "item", "제품", "리뷰"])]
+def detect_product_focus(text_lower: str, hashtags: List[str]) -> str:
+    has_product_word = _RE_PRODUCT_KWS.search(text_lower) is not None
+    product_tags = [h for h in hashtags if _RE_PRODUCT_TAG_KWS.search(h.lower())]
     if has_product_word or product_tags:
         tag_preview = ", ".join(product_tags[:3]) if product_tags else "관련 키워드 기반"
         return f"제품 주목성은 감지됨 ({tag_preview})."
     return "제품 중심 메시지는 상대적으로 약하거나 확인되지 않았습니다."
 
 
-def build_blog_overview(parsed: Dict[str, object]) -> List[str]:
-    text = str(parsed["text"])
-    images = parsed["images"]
-    image_with_alt = sum(1 for img in images if str(img.get("alt") or "").strip())
-    title = str(parsed.get("title") or "")
-    desc = str(parsed.get("description") or "")
-    audience = infer_audience(text, parsed.get("hashtags", []))
+def build_blog_overview(parsed: Parsed) -> List[str]:
+    text = parsed.text
+    images = parsed.images
+    title = parsed.title
+    desc = parsed.description
+    audience = infer_audience(parsed.text_lower, parsed.hashtags)
     maturity = content_maturity(parsed)
     image_types = "일반 이미지"
     if images:
-        hi_res = sum(
-            1
-            for img in images
-            if isinstance(img.get("width"), int)
-            and isinstance(img.get("height"), int)
-            and int(img["width"]) >= 500
-            and int(img["height"]) >= 500
-        )
-        image_types = f"고해상도 추정 {hi_res}장 / 전체 {len(images)}장"
+        image_types = f"고해상도 추정 {parsed.images_sized}장 / 전체 {len(images)}장"
     return [
         f"페이지 제목/설명: {snippet(coalesce(title, desc), 120)}",
         f"포스팅 내용 요약: {snippet(text, 200)}",
         f"콘텐츠 포지셔닝: {audience}, 포맷 성숙도: {maturity}",
-        f"첨부 이미지 요약: {image_types}, 대체텍스트(alt) 포함 {image_with_alt}장, 구조화데이터(JSON-LD) {parsed.get('json_ld_count', 0)}개",
+        f"첨부 이미지 요약: {image_types}, 대체텍스트(alt) 포함 {parsed.images_with_alt}장, 구조화데이터(JSON-LD) {parsed.json_ld_count}개",
     ]
 
 
-def build_insta_overview(parsed: Dict[str, object]) -> List[str]:
-    text = str(parsed["text"])
-    images = parsed["images"]
-    hashtags = parsed["hashtags"]
-    title = str(parsed.get("title") or "")
-    desc = str(parsed.get("description") or "")
-    audience = infer_audience(text, hashtags)
-    portrait_clues = len(re.findall(r"(portrait|face|selfie|인물|셀카)", text, flags=re.IGNORECASE))
+def build_insta_overview(parsed: Parsed) -> List[str]:
+    text = parsed.text
+    text_lower = parsed.text_lower
+    images = parsed.images
+    hashtags = parsed.hashtags
+    title = parsed.title
+    desc = parsed.description
+    audience = infer_audience(text_lower, hashtags)
+    portrait_clues = len(_RE_PORTRAIT.findall(text_lower))
     return [
         f"포스트 핵심 문구: {snippet(coalesce(desc, title, text), 120)}",
         f"타깃 오디언스 추정: {audience}",
-        f"이미지 배경 장소: {detect_place_clues(text)}",
+        f"이미지 배경 장소: {detect_place_clues(text_lower)}",
         f"인물 전반 평가: 인물/셀카 단서 {portrait_clues}건, 이미지 수 {len(images)}장 기반으로 시각 연출 품질을 판정했습니다.",
-        f"제품 주목성: {detect_product_focus(text, hashtags)}",
+        f"제품 주목성: {detect_product_focus(text_lower, hashtags)}",
     ]
 
 
-def build_blog_reviews(scores: Dict[str, float], parsed: Dict[str, object]) -> Dict[str, str]:
-    text = str(parsed["text"])
-    images = parsed["images"]
-    links = int(parsed["links"])
-    words = int(parsed.get("word_count", 0))
-    json_ld_count = int(parsed.get("json_ld_count", 0))
+def build_blog_reviews(scores: Dict[str, float], parsed: Parsed) -> Dict[str, str]:
+    text = parsed.text
+    images = parsed.images
+    links = parsed.links
+    words = parsed.word_count
+    json_ld_count = parsed.json_ld_count
+    text_lower = parsed.text_lower
     sentence_count, avg_len = sentence_stats(text)
-    opinion_hits = keyword_hits(text, ["느꼈", "생각", "체감", "개인적", "솔직히"])
-    evidence_hits = keyword_hits(text, ["근거", "출처", "통계", "공식", "실험", "비교"])
-    cta_hits = keyword_hits(text, ["추천", "구매", "방문", "문의", "신청", "클릭"])
-    emotional_hits = keyword_hits(text, ["감동", "만족", "아쉬움", "행복", "놀라", "최고"])
+    opinion_hits = keyword_hits(text_lower, ["느꼈", "생각", "체감", "개인적", "솔직히"])
+    evidence_hits = keyword_hits(text_lower, ["근거", "출처", "통계", "공식", "실험", "비교"])
+    cta_hits = keyword_hits(text_lower, ["추천", "구매", "방문", "문의", "신청", "클릭"])
+    emotional_hits = keyword_hits(text_lower, ["감동", "만족", "아쉬움", "행복", "놀라", "최고"])
 
     return {
         BLOG_RUBRIC[0]: compose_expert_review(
             scores[BLOG_RUBRIC[0]],
             strengths=[
                 f"이미지 {len(images)}장으로 시각 근거를 제시함" if len(images) > 0 else "이미지 확보가 거의 없음",
-                f"alt 텍스트 {sum(1 for i in images if i.get('alt'))}장으로 접근성 단서가 있음" if sum(1 for i in images if i.get("alt")) > 0 else "alt 기반 맥락 설명이 부족함",
+                f"alt 텍스트 {parsed.images_with_alt}장으로 접근성 단서가 있음" if parsed.images_with_alt > 0 else "alt 기반 맥락 설명이 부족함",
             ],
             weaknesses=[
                 "피사체/구도별 분류가 약해 메시지 전달력이 떨어질 수 있음" if len(images) < 4 else "이미지 간 역할 분담이 일부 중복됨",
@@ -653,17 +1064,17 @@ def build_blog_reviews(scores: Dict[str, float], parsed: Dict[str, object]) -> D
     }
 
 
-def build_insta_reviews(scores: Dict[str, float], parsed: Dict[str, object]) -> Dict[str, str]:
-    images = parsed["images"]
-    hashtags = parsed["hashtags"]
-    likes = parsed["likes"]
-    comments = parsed["comments"]
-    title = str(parsed.get("title") or "")
-    desc = str(parsed.get("description") or "")
+def build_insta_reviews(scores: Dict[str, float], parsed: Parsed) -> Dict[str, str]:
+    images = parsed.images
+    hashtags = parsed.hashtags
+    likes = parsed.likes
+    comments = parsed.comments
+    title = parsed.title
+    desc = parsed.description
     text_hint = coalesce(desc, title)
-    hook_hits = keyword_hits(text_hint, ["new", "첫", "한정", "공개", "단독", "비밀", "드디어"])
-    style_hits = keyword_hits(str(parsed.get("text", "")), ["무드", "룩", "톤", "감성", "필름", "시네마"])
-    hashtag_density = ratio(len(hashtags), max(1, int(parsed.get("word_count", 1))))
+    hook_hits = keyword_hits(text_hint.lower(), ["new", "첫", "한정", "공개", "단독", "비밀", "드디어"])
+    style_hits = keyword_hits(parsed.text_lower, ["무드", "룩", "톤", "감성", "필름", "시네마"])
+    hashtag_density = ratio(len(hashtags), max(1, parsed.word_count))
 
     return {
         INSTAGRAM_RUBRIC[0]: compose_expert_review(
@@ -726,31 +1137,25 @@ def build_insta_reviews(scores: Dict[str, float], parsed: Dict[str, object]) ->
 def sentence_stats(text: str) -> Tuple[int, float]:
     if not text:
         return 0, 0.0
-    sentences = re.split(r"[.!?]+", text)
-    sentences = [s.strip() for s in sentences if len(s.strip()) >= 2]
-    if not sentences:
+    count = 0
+    total = 0
+    for sentence in _RE_SENTENCE_SPLIT.split(text):
+        n = len(sentence.strip())
+        if n >= 2:
+            count += 1
+            total += n
+    if not count:
         return 0, 0.0
-    avg_len = sum(len(s) for s in sentences) / len(sentences)
-    return len(sentences), avg_len
+    return count, total / count
 
 
-def score_image_quality(images: List[Dict[str, object]]) -> float:
-    if not images:
+def score_image_quality(image_count: int, sized: int, with_alt: int) -> float:
+    if not image_count:
         return 2.0
 
-    count_score = min(2.0, len(images) / 5)
-    sized = 0
-    with_alt = 0
-    for img in images:
-        w = img.get("width")
-        h = img.get("height")
-        if isinstance(w, int) and isinstance(h, int) and w >= 500 and h >= 500:
-            sized += 1
-        if img.get("alt"):
-            with_alt += 1
-
-    size_score = min(1.5, sized / max(1, len(images)) * 1.5)
-    alt_score = min(1.5, with_alt / max(1, len(images)) * 1.5)
+    count_score = min(2.0, image_count / 5)
+    size_score = min(1.5, sized / image_count * 1.5)
+    alt_score = min(1.5, with_alt / image_count * 1.5)
     return clamp_1_5(1.0 + count_score + size_score + alt_score)
 
 
@@ -758,12 +1163,11 @@ def score_blog_sincerity_objectivity(text: str, links: int) -> float:
     if not text:
         return 2.0
 
-    objectivity_keywords = ["장점", "단점", "비교", "근거", "수치", "후기", "개인적", "주관", "객관"]
-    keyword_hits = sum(1 for kw in objectivity_keywords if kw in text)
-    keyword_score = min(2.0, keyword_hits * 0.25)
+    objectivity_hits = len(set(_RE_OBJECTIVITY_KWS.findall(text)))
+    keyword_score = min(2.0, objectivity_hits * 0.25)
     link_score = min(1.0, links * 0.2)
 
-    first_person_ratio = len(re.findall(r"(저|제가|나는|내가)", text)) / max(1.0, len(text) / 50)
+    first_person_ratio = len(_RE_FIRST_PERSON.findall(text)) / max(1.0, len(text) / 50)
     balance_score = 1.0 if 0.2 <= first_person_ratio <= 2.5 else 0.6
 
     return clamp_1_5(1.2 + keyword_score + link_score + balance_score)
@@ -774,8 +1178,7 @@ def score_blog_narrative(text: str) -> float:
     if sentence_count == 0:
         return 1.8
 
-    structure_words = ["처음", "먼저", "다음", "그리고", "결론", "정리", "마지막"]
-    structure_hits = sum(1 for w in structure_words if w in text)
+    structure_hits = len(set(_RE_STRUCTURE_KWS.findall(text)))
 
     sentence_score = 1.0 if 6 <= sentence_count <= 80 else 0.6
     length_score = 1.2 if 20 <= avg_len <= 70 else 0.7
@@ -788,9 +1191,9 @@ def score_blog_spelling(text: str) -> float:
     if not text:
         return 2.2
 
-    weird_spaces = len(re.findall(r"\s{2,}", text))
-    repeated_punct = len(re.findall(r"[!?.,]{3,}", text))
-    typo_like = len(re.findall(r"[ㄱ-ㅎㅏ-ㅣ]{3,}", text))
+    weird_spaces = len(_RE_MULTI_SPACE.findall(text))
+    repeated_punct = len(_RE_PUNCT_REPEAT.findall(text))
+    typo_like = len(_RE_JAMO.findall(text))
 
     penalties = weird_spaces * 0.1 + repeated_punct * 0.25 + typo_like * 0.25
     base = 4.6 - min(3.2, penalties)
@@ -801,26 +1204,24 @@ def score_blog_factuality(text: str, links: int) -> float:
     if not text:
         return 2.0
 
-    date_hits = len(re.findall(r"20\d{2}[./년-]\s?\d{1,2}", text))
-    number_hits = len(re.findall(r"\d+[.,]?\d*", text))
-    source_words = ["출처", "통계", "공식", "자료", "리포트", "논문"]
-    source_hits = sum(1 for w in source_words if w in text)
+    date_hits = len(_RE_DATE.findall(text))
+    number_hits = len(_RE_NUMBER.findall(text))
+    source_hits = len(set(_RE_SOURCE_KWS.findall(text)))
 
     evidence_score = min(2.5, date_hits * 0.5 + number_hits * 0.05 + source_hits * 0.5)
     link_score = min(1.0, links * 0.2)
     return clamp_1_5(1.0 + evidence_score + link_score)
 
 
-def score_insta_subject(images: List[Dict[str, object]]) -> float:
-    return score_image_quality(images)
+def score_insta_subject(image_count: int, sized: int, with_alt: int) -> float:
+    return score_image_quality(image_count, sized, with_alt)
 
 
-def score_insta_appearance(text: str, images: List[Dict[str, object]]) -> float:
-    if not images:
+def score_insta_appearance(text_lower: str, image_count: int, rich_alt: int) -> float:
+    if not image_count:
         return 2.5
 
-    portrait_clues = len(re.findall(r"(portrait|face|selfie|인물|셀카)", text, flags=re.IGNORECASE))
-    rich_alt = sum(1 for img in images if len(str(img.get("alt") or "")) >= 8)
+    portrait_clues = len(_RE_PORTRAIT.findall(text_lower))
     return clamp_1_5(2.0 + min(1.5, portrait_clues * 0.3) + min(1.5, rich_alt * 0.25))
 
 
@@ -829,8 +1230,14 @@ def score_insta_hashtag_rarity(hashtags: List[str]) -> float:
         return 2.0
 
     uniq = len(set(hashtags))
-    avg_len = sum(len(h) for h in hashtags) / len(hashtags)
-    short_generic = sum(1 for h in hashtags if len(h) <= 3)
+    total_len = 0
+    short_generic = 0
+    for h in hashtags:
+        n = len(h)
+        total_len += n
+        if n <= 3:
+            short_generic += 1
+    avg_len = total_len / len(hashtags)
 
     uniq_score = min(2.2, uniq / max(1, len(hashtags)) * 2.2)
     len_score = 1.2 if avg_len >= 6 else 0.7
@@ -849,53 +1256,60 @@ def score_insta_engagement(likes: int | None, comments: int | None) -> float:
     return clamp_1_5(1.0 + like_part + comment_part)
 
 
+_AI_CACHE = _TTLCache(AI_CACHE_SIZE, AI_CACHE_TTL)
+
+SALLY_AI_SYSTEM_PROMPT = (
+    "당신은 인플루언서/콘텐츠 전략 전문가 Sally다. "
+    "입력된 콘텐츠 증거를 기반으로 각 기준별로 1~5점(0.5 단위) 점수와 상세 심사평을 작성한다. "
+    "심사평은 항목마다 서로 다른 근거와 개선안을 제시하고, 비슷한 문장 반복을 피한다. "
+    "각 심사평은 반드시 '장점:', '단점:', '피드백:' 3구조를 포함한다. "
+    "사람 대신 심사하는 전문 리뷰어의 어조로 작성한다. "
+    "반드시 JSON만 출력한다."
+)
+# The request payload JSON is appended to this per call.
+SALLY_AI_USER_PROMPT_HEAD = (
+    "아래 JSON을 분석해 루브릭별 점수와 심사평을 출력해.\n"
+    "출력 형식(JSON):\n"
+    "{\n"
+    "  \"scores\": {\"<rubric>\": 1.0~5.0},\n"
+    "  \"reviews\": {\"<rubric>\": \"상세 심사평\"},\n"
+    "  \"summary\": \"전반 평가\"\n"
+    "}\n"
+    "입력 데이터: "
+)
+
+
 def request_sally_ai_review(
     content_type: str,
     url: str,
-    parsed: Dict[str, object],
+    parsed: Parsed,
     notes: List[str],
 ) -> Tuple[Dict[str, float], Dict[str, str], str, Dict[str, str]] | None:
     api_key = os.environ.get("OPENAI_API_KEY", "").strip()
-    if not api_key or requests is None:
+    if not api_key or _SESSION is None:
         return None
 
     rubric = BLOG_RUBRIC if content_type == "blog" else INSTAGRAM_RUBRIC
-    text = str(parsed.get("text", ""))[:6500]
+    text = parsed.text[:AI_TEXT_LIMIT]
     payload_for_model = {
         "url": url,
         "type": "네이버 블로그 포스팅" if content_type == "blog" else "인스타그램 피드",
-        "title": parsed.get("title", ""),
-        "description": parsed.get("description", ""),
+        "title": parsed.title[:AI_META_LIMIT],
+        "description": parsed.description[:AI_META_LIMIT],
         "text_excerpt": text,
-        "images_count": len(parsed.get("images", [])),
-        "links_count": parsed.get("links", 0),
-        "hashtags": parsed.get("hashtags", []),
-        "likes": parsed.get("likes"),
-        "comments": parsed.get("comments"),
-        "video_embedded": parsed.get("video_embedded", False),
-        "map_embedded": parsed.get("map_embedded", False),
+        "images_count": len(parsed.images),
+        "links_count": parsed.links,
+        "hashtags": parsed.hashtags,
+        "likes": parsed.likes,
+        "comments": parsed.comments,
+        "video_embedded": parsed.video_embedded,
+        "map_embedded": parsed.map_embedded,
         "rubric": rubric,
     }
     prompt_json = json.dumps(payload_for_model, ensure_ascii=False)
 
-    system_prompt = (
-        "당신은 인플루언서/콘텐츠 전략 전문가 Sally다. "
-        "입력된 콘텐츠 증거를 기반으로 각 기준별로 1~5점(0.5 단위) 점수와 상세 심사평을 작성한다. "
-        "심사평은 항목마다 서로 다른 근거와 개선안을 제시하고, 비슷한 문장 반복을 피한다. "
-        "각 심사평은 반드시 '장점:', '단점:', '피드백:' 3구조를 포함한다. "
-        "사람 대신 심사하는 전문 리뷰어의 어조로 작성한다. "
-        "반드시 JSON만 출력한다."
-    )
-    user_prompt = (
-        "아래 JSON을 분석해 루브릭별 점수와 심사평을 출력해.\n"
-        "출력 형식(JSON):\n"
-        "{\n"
-        "  \"scores\": {\"<rubric>\": 1.0~5.0},\n"
-        "  \"reviews\": {\"<rubric>\": \"상세 심사평\"},\n"
-        "  \"summary\": \"전반 평가\"\n"
-        "}\n"
-        f"입력 데이터: {prompt_json}"
-    )
+    system_prompt = SALLY_AI_SYSTEM_PROMPT
+    user_prompt = SALLY_AI_USER_PROMPT_HEAD + prompt_json
 
     body = {
         "model": "gpt-4.1-mini",
@@ -907,30 +1321,44 @@ def request_sally_ai_review(
         "temperature": 0.4,
     }
 
+    # Keyed by a fingerprint of the API key (never the key itself) and a digest of
+    # the encoded request body, so a re-run of the same page skips the API round
+    # trip. The same bytes are what gets sent.
+    request_body = _json_dumps(body)
+    cache_key = (
+        hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+        hashlib.blake2b(request_body, digest_size=16).hexdigest(),
+    )
+    cached = _AI_CACHE.get(cache_key)
+    if cached is not None:
+        cached_scores, cached_reviews, cached_summary = cached
+        token_usage = build_token_usage("Sally AI 직접 평가(캐시 재사용, 추가 과금 없음)", 0, 0)
+        return dict(cached_scores), dict(cached_reviews), cached_summary, token_usage
+
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             "https://api.openai.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
-            json=body,
-            timeout=40,
+            data=request_body,
+            timeout=AI_TIMEOUT,
         )
         if not resp.ok:
             notes.append(f"Sally AI 평가 호출 실패(HTTP {resp.status_code})")
             return None
 
-        data = resp.json()
+        data = _json_loads(resp.content)
         content = data["choices"][0]["message"]["content"]
-        parsed_json = json.loads(content)
+        parsed_json = _json_loads(content)
         ai_scores: Dict[str, float] = {}
         ai_reviews: Dict[str, str] = {}
         for r in rubric:
             raw_score = parsed_json.get("scores", {}).get(r, 2.5)
             try:
                 val = round_half(clamp_1_5(float(raw_score)))
-            except Exception:
+            except (TypeError, ValueError):
                 val = 2.5
             ai_scores[r] = val
 
@@ -942,8 +1370,13 @@ def request_sally_ai_review(
         prompt_tokens = int(usage.get("prompt_tokens", estimate_tokens(system_prompt + user_prompt)))
         completion_tokens = int(usage.get("completion_tokens", estimate_tokens(content)))
         token_usage = build_token_usage("Sally AI 직접 평가", prompt_tokens, completion_tokens)
+        _AI_CACHE.put(cache_key, (dict(ai_scores), dict(ai_reviews), summary))
         return ai_scores, ai_reviews, summary, token_usage
-    except Exception as exc:
+    except requests.RequestException as exc:
+        notes.append(f"Sally AI 평가 호출 실패: {exc}")
+        return None
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError) as exc:
+        # Undecodable body or a reply that does not follow the requested JSON shape.
         notes.append(f"Sally AI 평가 실패: {exc}")
         return None
 
@@ -966,57 +1399,88 @@ def build_summary(content_type: str, avg: float, scores: Dict[str, float]) -> st
     )
 
 
+_EVAL_CACHE = _TTLCache(EVAL_CACHE_SIZE, EVAL_CACHE_TTL)
+
+
 def evaluate(content_type: str, url: str) -> EvalResult:
-    html_text, notes = fetch_html(url)
-    parsed = parse_common(html_text, source_url=url)
+    key = (content_type, url)
+    result = _EVAL_CACHE.get(key)
+    if result is not None:
+        return result
+    html_text, notes, partial = fetch_html(url)
+    result, ai_failed = evaluate_html(content_type, url, html_text, notes)
+    if html_text and not partial and not ai_failed:
+        # Failed fetches (including a frameset whose PostView hop failed) and failed
+        # Sally AI calls are not cached so the next request retries them instead of
+        # serving the thin or local-fallback result.
+        _EVAL_CACHE.put(key, result)
+    return result
+
+
+def evaluate_html(
+    content_type: str, url: str, html_text: str, notes: List[str]
+) -> Tuple[EvalResult, bool]:
+    # The flag is True when API mode is on but the Sally AI call failed and the
+    # local scorers stood in.
+    use_api = use_api_evaluator()
+    # Local blog scoring never reads likes/comments; the Instagram scorers and the
+    # API payload do.
+    parsed = parse_common(html_text, source_url=url, engagement=content_type == "instagram" or use_api)
     dashboard = build_dashboard(parsed)
     ai_result = None
-    if use_api_evaluator():
+    if use_api:
         ai_result = request_sally_ai_review(content_type, url, parsed, notes)
+    ai_failed = use_api and ai_result is None
 
     if content_type == "instagram":
         if ai_result is not None:
             scores, reviews, summary, token_usage = ai_result
             overview = build_insta_overview(parsed)
             avg = round_half(sum(scores.values()) / len(scores))
-            return EvalResult("인스타그램 피드", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes)
-
-        scores = {
-            INSTAGRAM_RUBRIC[0]: round_half(score_insta_subject(parsed["images"])),
-            INSTAGRAM_RUBRIC[1]: round_half(score_insta_appearance(parsed["text"], parsed["images"])),
-            INSTAGRAM_RUBRIC[2]: round_half(score_insta_hashtag_rarity(parsed["hashtags"])),
-            INSTAGRAM_RUBRIC[3]: round_half(score_insta_engagement(parsed["likes"], parsed["comments"])),
-        }
+            return EvalResult("인스타그램 피드", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes), False
+
+        scores = round_scores(
+            INSTAGRAM_RUBRIC,
+            (
+                score_insta_subject(len(parsed.images), parsed.images_sized, parsed.images_with_alt),
+                score_insta_appearance(parsed.text_lower, len(parsed.images), parsed.images_rich_alt),
+                score_insta_hashtag_rarity(parsed.hashtags),
+                score_insta_engagement(parsed.likes, parsed.comments),
+            ),
+        )
         reviews = build_insta_reviews(scores, parsed)
         overview = build_insta_overview(parsed)
         avg = round_half(sum(scores.values()) / len(scores))
         summary = build_summary("인스타그램 피드", avg, scores)
         token_usage = build_token_usage("로컬 평가(추가 API 과금 없음)", 0, 0)
-        return EvalResult("인스타그램 피드", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes)
+        return EvalResult("인스타그램 피드", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes), ai_failed
 
     if ai_result is not None:
         scores, reviews, summary, token_usage = ai_result
         overview = build_blog_overview(parsed)
         avg = round_half(sum(scores.values()) / len(scores))
-        return EvalResult("네이버 블로그 포스팅", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes)
-
-    scores = {
-        BLOG_RUBRIC[0]: round_half(score_image_quality(parsed["images"])),
-        BLOG_RUBRIC[1]: round_half(score_blog_sincerity_objectivity(parsed["text"], parsed["links"])),
-        BLOG_RUBRIC[2]: round_half(score_blog_narrative(parsed["text"])),
-        BLOG_RUBRIC[3]: round_half(score_blog_spelling(parsed["text"])),
-        BLOG_RUBRIC[4]: round_half(score_blog_factuality(parsed["text"], parsed["links"])),
-    }
+        return EvalResult("네이버 블로그 포스팅", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes), False
+
+    text = parsed.text
+    scores = round_scores(
+        BLOG_RUBRIC,
+        (
+            score_image_quality(len(parsed.images), parsed.images_sized, parsed.images_with_alt),
+            score_blog_sincerity_objectivity(text, parsed.links),
+            score_blog_narrative(text),
+            score_blog_spelling(text),
+            score_blog_factuality(text, parsed.links),
+        ),
+    )
     reviews = build_blog_reviews(scores, parsed)
     overview = build_blog_overview(parsed)
     avg = round_half(sum(scores.values()) / len(scores))
     summary = build_summary("네이버 블로그 포스팅", avg, scores)
     token_usage = build_token_usage("로컬 평가(추가 API 과금 없음)", 0, 0)
-    return EvalResult("네이버 블로그 포스팅", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes)
+    return EvalResult("네이버 블로그 포스팅", url, scores, reviews, overview, dashboard, token_usage, avg, summary, notes), ai_failed
 
 
-def render_page(result: EvalResult | None = None, error: str = "") -> str:
-    style = """
+_PAGE_STYLE = """
     <style>
       :root { --bg:#f4f7fb; --card:#fff; --text:#102a43; --muted:#486581; --line:#d9e2ec; --ok:#0b6e4f; --err:#b42318; }
       * { box-sizing: border-box; }
@@ -1040,7 +1504,8 @@ def render_page(result: EvalResult | None = None, error: str = "") -> str:
     </style>
     """
 
-    form_html = """
+_FORM_TMPL = string.Template(
+    """
     <div class='card'>
       <h1>Sally 콘텐츠 평가기</h1>
       <p class='sub'>URL을 입력하면 동일한 루브릭으로 항목별 별점(1~5)과 평균 점수를 계산합니다.</p>
@@ -1056,111 +1521,163 @@ def render_page(result: EvalResult | None = None, error: str = "") -> str:
 
         <button type='submit'>Sally 평가 실행</button>
       </form>
-      {error_block}
+      $error_block
     </div>
     """
+)
 
-    error_block = f"<p class='err'>{html.escape(error)}</p>" if error else ""
-    result_block = ""
-
-    if result:
-        rows = "".join(
-            (
-                f"<tr><td>{html.escape(k)}"
-                f"<div class='review'>{html.escape(result.reviews.get(k, ''))}</div>"
-                f"</td><td>{v:.1f} / 5</td></tr>"
-            )
-            for k, v in result.scores.items()
-        )
-        overview_items = "".join(f"<li>{html.escape(item)}</li>" for item in result.overview)
-        overview_block = f"<div class='overview'><h3>콘텐츠 요약정보</h3><ul>{overview_items}</ul></div>"
-        dashboard_items = "".join(
-            f"<li><strong>{html.escape(k)}:</strong> {html.escape(v)}</li>" for k, v in result.dashboard.items()
-        )
-        dashboard_block = f"<div class='overview'><h3>포스팅 컨디션 대시보드</h3><ul>{dashboard_items}</ul></div>"
-        token_items = "".join(
-            f"<li><strong>{html.escape(k)}:</strong> {html.escape(v)}</li>" for k, v in result.token_usage.items()
-        )
-        token_block = f"<div class='overview'><h3>토큰 사용량</h3><ul>{token_items}</ul></div>"
-        notes_block = ""
-        if result.notes:
-            notes_items = "".join(f"<li>{html.escape(n)}</li>" for n in result.notes)
-            notes_block = f"<div class='notes'><h3>참고</h3><ul>{notes_items}</ul></div>"
-
-        result_block = f"""
+_RESULT_TMPL = string.Template(
+    """
         <div class='card'>
           <h2>평가 결과</h2>
-          <p><strong>유형:</strong> {html.escape(result.content_type)}</p>
-          <p><strong>URL:</strong> <a href='{html.escape(result.url)}' target='_blank'>{html.escape(result.url)}</a></p>
-          {dashboard_block}
-          {token_block}
-          {overview_block}
+          <p><strong>유형:</strong> $content_type</p>
+          <p><strong>URL:</strong> <a href='$url' target='_blank'>$url</a></p>
+          $dashboard_block
+          $token_block
+          $overview_block
           <table>
             <thead><tr><th>평가 항목 및 심사평</th><th>별점</th></tr></thead>
-            <tbody>{rows}</tbody>
+            <tbody>$rows</tbody>
           </table>
-          <p class='avg'>평균 별점: {result.average:.1f} / 5</p>
-          <p>{html.escape(result.summary)}</p>
-          {notes_block}
+          <p class='avg'>평균 별점: $average / 5</p>
+          <p>$summary</p>
+          $notes_block
         </div>
         """
+)
 
-    page = f"""
+_PAGE_TMPL = string.Template(
+    """
     <!doctype html>
     <html lang='ko'>
       <head>
         <meta charset='utf-8' />
         <meta name='viewport' content='width=device-width, initial-scale=1' />
         <title>Sally 콘텐츠 별점 평가</title>
-        {style}
+        $style
       </head>
       <body>
         <main class='wrap'>
-          {form_html.format(error_block=error_block)}
-          {result_block}
+          $form
+          $result_block
         </main>
       </body>
     </html>
     """
-    return page
+)
 
+_ROW_TMPL = "<tr><td>{k}<div class='review'>{r}</div></td><td>{v:.1f} / 5</td></tr>"
+_ITEM_TMPL = "<li>{}</li>"
+_KV_ITEM_TMPL = "<li><strong>{k}:</strong> {v}</li>"
 
-class SallyHandler(BaseHTTPRequestHandler):
-    def _send_html(self, body: str, status: int = 200) -> None:
-        encoded = body.encode("utf-8")
-        self.send_response(status)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(encoded)))
-        self.end_headers()
-        self.wfile.write(encoded)
 
-    def do_GET(self) -> None:  # noqa: N802
-        self._send_html(render_page())
+def render_page(result: EvalResult | None = None, error: str = "") -> str:
+    esc = html.escape
+    error_block = f"<p class='err'>{esc(error)}</p>" if error else ""
+    result_block = ""
 
-    def do_POST(self) -> None:  # noqa: N802
-        content_len = int(self.headers.get("Content-Length", "0"))
-        raw = self.rfile.read(content_len).decode("utf-8", errors="replace")
-        data = parse_qs(raw)
+    if result:
+        reviews = result.reviews
+        rows = "".join(_ROW_TMPL.format(k=esc(k), r=esc(reviews.get(k, "")), v=v) for k, v in result.scores.items())
+        overview_items = "".join(_ITEM_TMPL.format(esc(item)) for item in result.overview)
+        overview_block = f"<div class='overview'><h3>콘텐츠 요약정보</h3><ul>{overview_items}</ul></div>"
+        dashboard_items = "".join(_KV_ITEM_TMPL.format(k=esc(k), v=esc(v)) for k, v in result.dashboard.items())
+        dashboard_block = f"<div class='overview'><h3>포스팅 컨디션 대시보드</h3><ul>{dashboard_items}</ul></div>"
+        token_items = "".join(_KV_ITEM_TMPL.format(k=esc(k), v=esc(v)) for k, v in result.token_usage.items())
+        token_block = f"<div class='overview'><h3>토큰 사용량</h3><ul>{token_items}</ul></div>"
+        notes_block = ""
+        if result.notes:
+            notes_items = "".join(_ITEM_TMPL.format(esc(n)) for n in result.notes)
+            notes_block = f"<div class='notes'><h3>참고</h3><ul>{notes_items}</ul></div>"
 
-        content_type = (data.get("content_type", ["blog"])[0] or "blog").strip()
-        url = (data.get("url", [""])[0] or "").strip()
+        result_block = _RESULT_TMPL.substitute(
+            content_type=esc(result.content_type),
+            url=esc(result.url),
+            dashboard_block=dashboard_block,
+            token_block=token_block,
+            overview_block=overview_block,
+            rows=rows,
+            average=f"{result.average:.1f}",
+            summary=esc(result.summary),
+            notes_block=notes_block,
+        )
 
-        error = ""
-        result = None
+    return _PAGE_TMPL.substitute(
+        style=_PAGE_STYLE,
+        form=_FORM_TMPL.substitute(error_block=error_block),
+        result_block=result_block,
+    )
+
+
+# The GET page has no inputs, so it is rendered once.
+_BLANK_PAGE = render_page()
+
+
+def _accepts_gzip(environ: Dict[str, Any]) -> bool:
+    # An explicit gzip entry wins over "*" wherever it appears; q=0 means refused.
+    qvalues: Dict[str, float] = {}
+    for part in str(environ.get("HTTP_ACCEPT_ENCODING", "")).lower().split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip()
+        if coding in ("gzip", "*"):
+            q = params.replace(" ", "")
+            try:
+                qvalues[coding] = float(q[2:]) if q.startswith("q=") else 1.0
+            except ValueError:
+                qvalues[coding] = 1.0
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+def _html_response(
+    environ: Dict[str, Any], start_response: Any, body: str, status: str = "200 OK"
+) -> List[bytes]:
+    encoded = body.encode("utf-8")
+    headers = [("Content-Type", "text/html; charset=utf-8"), ("Vary", "Accept-Encoding")]
+    if len(encoded) >= GZIP_THRESHOLD and _accepts_gzip(environ):
+        # Level 1: most of the size win on repetitive HTML at a fraction of the CPU.
+        encoded = gzip.compress(encoded, compresslevel=1)
+        headers.append(("Content-Encoding", "gzip"))
+    headers.append(("Content-Length", str(len(encoded))))
+    start_response(status, headers)
+    return [encoded]
+
+
+def application(environ: Dict[str, Any], start_response: Any) -> List[bytes]:
+    # WSGI entry point, e.g. `gunicorn app:application -w 4 -k gthread --threads 8`.
+    if environ.get("REQUEST_METHOD", "GET").upper() != "POST":
+        return _html_response(environ, start_response, _BLANK_PAGE)
+
+    try:
+        content_len = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        content_len = 0
+    raw = environ["wsgi.input"].read(content_len).decode("utf-8", errors="replace") if content_len > 0 else ""
+    data = parse_qs(raw)
+
+    content_type = (data.get("content_type", ["blog"])[0] or "blog").strip()
+    url = (data.get("url", [""])[0] or "").strip()
+
+    error = ""
+    result = None
+
+    parsed = urlparse(url)
+    if not url:
+        error = "URL을 입력해 주세요."
+    elif parsed.scheme not in ("http", "https"):
+        error = "http:// 또는 https:// URL만 지원합니다."
+    else:
+        result = evaluate(content_type, url)
+
+    return _html_response(environ, start_response, render_page(result=result, error=error))
 
-        parsed = urlparse(url)
-        if not url:
-            error = "URL을 입력해 주세요."
-        elif parsed.scheme not in ("http", "https"):
-            error = "http:// 또는 https:// URL만 지원합니다."
-        else:
-            result = evaluate(content_type, url)
 
-        self._send_html(render_page(result=result, error=error))
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    # A slow fetch for one client must not block the others.
+    daemon_threads = True
 
 
 def run_server(host: str = HOST, port: int = PORT) -> None:
-    server = HTTPServer((host, port), SallyHandler)
+    server = make_server(host, port, application, server_class=_ThreadingWSGIServer)
     print(f"Sally 평가기 실행: http://{host}:{port}")
     server.serve_forever()
 
@@ -349,17 +349,25 @@ with st.form("evaluate_form"):
         url = st.text_input("콘텐츠 URL", placeholder="https://...")
     run = st.form_submit_button("Sally 평가 실행", type="primary")
 
+show_last = True
 if run:
     if not url.strip():
         st.error("URL을 입력해 주세요.")
+        show_last = False
     elif not (url.startswith("http://") or url.startswith("https://")):
         st.error("http:// 또는 https:// URL만 지원합니다.")
+        show_last = False
     else:
         content_type = "blog" if content_type_label == "네이버 블로그 포스팅" else "instagram"
         with st.spinner("Sally가 콘텐츠를 직접 분석 중입니다..."):
             result = evaluate(content_type, url.strip())
-
-        render_dashboard(result)
-        render_token_panel(result)
-        render_reviews(result)
-        render_notes(result)
+        st.session_state["last_analysis"] = result
+
+# Any widget interaction reruns this script; redraw the last evaluation from session
+# state instead of dropping it (or re-running evaluate) until the form is submitted again.
+result = st.session_state.get("last_analysis")
+if show_last and result is not None:
+    render_dashboard(result)
+    render_token_panel(result)
+    render_reviews(result)
+    render_notes(result)